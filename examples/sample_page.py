@@ -1,5 +1,7 @@
 """Example page object for demonstration."""
 
+from playwright.sync_api import Locator
+
 from webtest_framework import BasePage
 
 
@@ -28,6 +30,11 @@ class SearchPage(BasePage):
             .wait_for_load()
         )
 
+    @property
+    def results(self) -> Locator:
+        """Locator for the result items (cached via the BasePage locator cache)."""
+        return self.locator(self.RESULT_ITEM)
+
     def get_result_count(self) -> int:
         """Get number of search results."""
         return self.count(self.RESULT_ITEM)
@@ -49,6 +56,5 @@ class SearchPage(BasePage):
 
     def click_result(self, index: int = 0):
         """Click a search result by index."""
-        items = self.locator(self.RESULT_ITEM)
-        items.nth(index).click()
+        self.results.nth(index).click()
         return self
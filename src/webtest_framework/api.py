@@ -1,19 +1,58 @@
 """API testing utilities."""
 
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any
+from datetime import timedelta
+from typing import Any, Iterator
 
-import requests
+import httpx
+import orjson
 
+_MS = timedelta(milliseconds=1)
 
-@dataclass
+
+class _LazyHeaders(Mapping):
+    """Deferred copy of response headers.
+
+    Copying the case-insensitive header mapping into a dict on every
+    request is wasted work when most tests never read headers; the copy
+    happens on first access instead. The Mapping ABC supplies keys/items/
+    values/get/__contains__/__eq__ on top of the three methods below.
+    """
+
+    __slots__ = ("_raw", "_cached")
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._cached: dict | None = None
+
+    def _materialize(self) -> dict:
+        if self._cached is None:
+            self._cached = dict(self._raw)
+        return self._cached
+
+    def __getitem__(self, key: str) -> str:
+        return self._materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
+@dataclass(slots=True, frozen=True)
 class Response:
     """API response wrapper."""
 
     status_code: int
     json_data: dict | list | None
     text: str
-    headers: dict
+    headers: Mapping[str, str]
     elapsed_ms: float
 
     @property
@@ -31,17 +70,27 @@ class Response:
 class APIClient:
     """HTTP API client for testing APIs."""
 
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(self, base_url: str, timeout: int = 10, pool_size: int = 64):
         """Initialize API client.
 
         Args:
             base_url: Base URL for API
             timeout: Request timeout in seconds
+            pool_size: Connection pool size for keep-alive socket reuse
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = httpx.Client(
+            base_url=self.base_url,
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+        )
         self.default_headers: dict[str, str] = {}
+        self._url_cache: dict[str, httpx.URL] = {}
 
     def set_header(self, key: str, value: str) -> "APIClient":
         """Set a default header."""
@@ -60,28 +109,31 @@ class APIClient:
         **kwargs,
     ) -> Response:
         """Make HTTP request."""
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        headers = {**self.default_headers, **kwargs.pop("headers", {})}
+        extra = kwargs.pop("headers", None)
+        headers = {**self.default_headers, **extra} if extra else self.default_headers
+
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.session._merge_url(path.lstrip("/"))
 
         response = self.session.request(
             method,
             url,
             headers=headers,
-            timeout=self.timeout,
             **kwargs,
         )
 
         try:
-            json_data = response.json()
-        except ValueError:
+            json_data = orjson.loads(response.content) if response.content else None
+        except orjson.JSONDecodeError:
             json_data = None
 
         return Response(
             status_code=response.status_code,
             json_data=json_data,
             text=response.text,
-            headers=dict(response.headers),
-            elapsed_ms=response.elapsed.total_seconds() * 1000,
+            headers=_LazyHeaders(response.headers),
+            elapsed_ms=response.elapsed / _MS,
         )
 
     def get(self, path: str, params: dict | None = None, **kwargs) -> Response:
@@ -105,6 +157,88 @@ class APIClient:
         return self._make_request("DELETE", path, **kwargs)
 
 
+class AsyncAPIClient:
+    """Async HTTP API client for issuing batches of requests concurrently.
+
+    Independent API probes that would each block on a round trip through
+    `APIClient` can be submitted together and awaited as one batch.
+    """
+
+    def __init__(self, base_url: str, timeout: int = 10, pool_size: int = 64):
+        """Initialize async API client.
+
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            pool_size: Connection pool size for keep-alive socket reuse
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+        )
+        self.default_headers: dict[str, str] = {}
+        self._url_cache: dict[str, httpx.URL] = {}
+
+    async def _make_request(self, method: str, path: str, **kwargs) -> Response:
+        """Make HTTP request."""
+        extra = kwargs.pop("headers", None)
+        headers = {**self.default_headers, **extra} if extra else self.default_headers
+
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.session._merge_url(path.lstrip("/"))
+
+        response = await self.session.request(
+            method,
+            url,
+            headers=headers,
+            **kwargs,
+        )
+
+        try:
+            json_data = orjson.loads(response.content) if response.content else None
+        except orjson.JSONDecodeError:
+            json_data = None
+
+        return Response(
+            status_code=response.status_code,
+            json_data=json_data,
+            text=response.text,
+            headers=_LazyHeaders(response.headers),
+            elapsed_ms=response.elapsed / _MS,
+        )
+
+    async def gather(self, specs: list[tuple[str, str, dict]]) -> list[Response]:
+        """Issue a batch of requests concurrently.
+
+        Args:
+            specs: List of (method, path, kwargs) tuples
+
+        Returns:
+            Responses in the same order as the specs
+        """
+        return await asyncio.gather(
+            *(self._make_request(method, path, **kwargs) for method, path, kwargs in specs)
+        )
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
 def assert_status(response: Response, expected: int):
     """Assert response status code."""
     assert response.status_code == expected, (
@@ -115,10 +249,14 @@ def assert_status(response: Response, expected: int):
 def assert_json_contains(response: Response, key: str, value: Any = None):
     """Assert JSON response contains key (and optionally value)."""
     data = response.json()
-    assert isinstance(data, dict), "Response is not a JSON object"
-    assert key in data, f"Key '{key}' not found in response"
-    if value is not None:
-        assert data[key] == value, f"Expected {key}={value}, got {data[key]}"
+    if not isinstance(data, dict):
+        raise AssertionError("Response is not a JSON object")
+    try:
+        actual = data[key]
+    except KeyError:
+        raise AssertionError(f"Key '{key}' not found in response") from None
+    if value is not None and actual != value:
+        raise AssertionError(f"Expected {key}={value}, got {actual}")
 
 
 def assert_response_time(response: Response, max_ms: float):
@@ -1,9 +1,16 @@
 """Custom assertions for test framework."""
 
 from playwright.sync_api import Page, Locator, expect
+import functools
 import re
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a regex pattern, cached per distinct pattern string."""
+    return re.compile(pattern)
+
+
 def expect_element(locator: Locator):
     """Get Playwright expect for a locator.
 
@@ -54,7 +61,7 @@ def expect_attribute(locator: Locator, attribute: str, value: str | re.Pattern):
 
 def expect_class(locator: Locator, class_name: str):
     """Assert element has CSS class."""
-    expect(locator).to_have_class(re.compile(class_name))
+    expect(locator).to_have_class(_compile(class_name))
 
 
 def expect_enabled(locator: Locator):
@@ -1,14 +1,21 @@
 """Configuration management for test framework."""
 
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-class BrowserConfig(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class BrowserConfig:
     """Browser configuration."""
 
     headless: bool = True
@@ -18,7 +25,24 @@ class BrowserConfig(BaseModel):
     timeout: int = 30000
 
 
-class Config(BaseModel):
+# (env var, nested config target, converter) — from_env walks this table.
+_ENV_MAP = (
+    ("TEST_BASE_URL", ("base_url",), str),
+    ("TEST_HEADLESS", ("browser", "headless"), lambda v: v.lower() == "true"),
+    ("TEST_TIMEOUT", ("browser", "timeout"), int),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict:
+    """Read and parse a YAML config file, cached on (path, mtime)."""
+    # Binary mode hands libyaml raw bytes, skipping Python-side UTF-8 decode.
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@dataclass(slots=True, frozen=True)
+class Config:
     """Test framework configuration."""
 
     base_url: str = "http://localhost:8000"
@@ -27,33 +51,52 @@ class Config(BaseModel):
     screenshot_dir: str = "screenshots"
     api_timeout: int = 10
 
+    @classmethod
+    def _from_dict(cls, data: dict) -> "Config":
+        """Build a Config from a plain dict, ignoring unknown keys."""
+        fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        browser = fields.get("browser")
+        if isinstance(browser, dict):
+            fields["browser"] = BrowserConfig(
+                **{k: v for k, v in browser.items() if k in BrowserConfig.__dataclass_fields__}
+            )
+        return cls(**fields)
+
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
-        """Load configuration from YAML file."""
-        path = Path(path)
-        if not path.exists():
+        """Load configuration from YAML file.
+
+        Parsed and validated configs are cached on (path, mtime), so
+        repeated loads of an unchanged file skip disk I/O entirely.
+        """
+        path = Path(path).resolve()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        return cls._from_yaml_cached(str(path), mtime_ns)
 
-        return cls(**data) if data else cls()
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _from_yaml_cached(cls, path_str: str, mtime_ns: int) -> "Config":
+        """Construct a validated Config, cached on (path, mtime)."""
+        data = _load_yaml_cached(path_str, mtime_ns)
+        return cls._from_dict(data) if data else cls()
 
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
         config_data: dict[str, Any] = {}
 
-        if base_url := os.getenv("TEST_BASE_URL"):
-            config_data["base_url"] = base_url
-
-        if headless := os.getenv("TEST_HEADLESS"):
-            config_data.setdefault("browser", {})["headless"] = headless.lower() == "true"
-
-        if timeout := os.getenv("TEST_TIMEOUT"):
-            config_data.setdefault("browser", {})["timeout"] = int(timeout)
+        for env_name, target, convert in _ENV_MAP:
+            if raw := os.getenv(env_name):
+                node = config_data
+                for part in target[:-1]:
+                    node = node.setdefault(part, {})
+                node[target[-1]] = convert(raw)
 
-        return cls(**config_data)
+        return cls._from_dict(config_data)
 
     def get_viewport(self) -> dict[str, int]:
         """Get viewport size as dict."""
@@ -5,29 +5,131 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 
 from .config import Config
 
 
-@pytest.fixture(scope="session")
-def config() -> Config:
-    """Load test configuration."""
+def _load_config() -> Config:
+    """Load configuration the same way the session config fixture does."""
     config_path = Path("config.yaml")
     if config_path.exists():
         return Config.from_yaml(config_path)
     return Config.from_env()
 
 
-@pytest.fixture(scope="session")
-def browser_type_launch_args(config: Config) -> dict:
-    """Browser launch arguments."""
+def _launch_args(config: Config) -> dict:
+    """Browser launch arguments derived from a Config."""
     return {
         "headless": config.browser.headless,
         "slow_mo": config.browser.slow_mo,
     }
 
 
+def pytest_configure(config):
+    """Launch one shared browser server when running under pytest-xdist.
+
+    The controller starts a single Chromium server and publishes its
+    WebSocket endpoint to workers, so N workers share one browser process
+    instead of spawning N of them. Each test still gets its own context.
+
+    The shared server is chromium-only: runs selecting another browser
+    via --browser fall back to one browser per worker. Note this starts
+    Chromium eagerly for every -n run, even suites that never touch a
+    browser fixture; set PLAYWRIGHT_WS_ENDPOINT to reuse an external
+    server, or run without -n, to avoid it.
+    """
+    if hasattr(config, "workerinput"):
+        return
+    browsers = config.getoption("browser", [])
+    if browsers and browsers != ["chromium"]:
+        return
+    if config.pluginmanager.hasplugin("xdist") and config.getoption("numprocesses", None):
+        playwright = sync_playwright().start()
+        server = playwright.chromium.launch_server(**_launch_args(_load_config()))
+        config._playwright_server = (playwright, server)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Publish the shared browser's WS endpoint to each xdist worker."""
+    shared = getattr(node.config, "_playwright_server", None)
+    if shared is not None:
+        node.workerinput["playwright_ws_endpoint"] = shared[1].ws_endpoint
+
+
+def pytest_unconfigure(config):
+    """Shut down the shared browser server on the xdist controller."""
+    shared = getattr(config, "_playwright_server", None)
+    if shared is not None:
+        playwright, server = shared
+        server.close()
+        playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def playwright_instance() -> Generator[Playwright, None, None]:
+    """Start a single Playwright driver for the whole session."""
+    playwright = sync_playwright().start()
+    yield playwright
+    playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def browser(
+    playwright_instance: Playwright,
+    browser_type_launch_args: dict,
+    browser_name: str,
+    request,
+) -> Generator[Browser, None, None]:
+    """Launch one browser per session; tests get isolated contexts instead.
+
+    The browser type follows pytest-playwright's --browser option. Under
+    xdist, workers connect to the controller's shared browser server
+    rather than launching their own; that server is chromium-only.
+    """
+    workerinput = getattr(request.config, "workerinput", None)
+    ws_endpoint = os.getenv("PLAYWRIGHT_WS_ENDPOINT")
+    if workerinput is not None:
+        ws_endpoint = workerinput.get("playwright_ws_endpoint", ws_endpoint)
+
+    browser_type = getattr(playwright_instance, browser_name)
+    if ws_endpoint:
+        browser = browser_type.connect(ws_endpoint)
+    else:
+        browser = browser_type.launch(**browser_type_launch_args)
+    yield browser
+    browser.close()
+
+
+@pytest.fixture
+def context(
+    browser: Browser, browser_context_args: dict
+) -> Generator[BrowserContext, None, None]:
+    """Fresh browser context per test (much cheaper than a new browser)."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(context: BrowserContext) -> Page:
+    """Page from the per-test context."""
+    return context.new_page()
+
+
+@pytest.fixture(scope="session")
+def config() -> Config:
+    """Load test configuration."""
+    return _load_config()
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(config: Config) -> dict:
+    """Browser launch arguments."""
+    return _launch_args(config)
+
+
 @pytest.fixture(scope="session")
 def browser_context_args(config: Config) -> dict:
     """Browser context arguments."""
@@ -37,7 +139,7 @@ def browser_context_args(config: Config) -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def screenshot_dir(config: Config) -> Path:
     """Get screenshot directory, creating if needed."""
     path = Path(config.screenshot_dir)
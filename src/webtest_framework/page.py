@@ -1,6 +1,6 @@
 """Base page object for Page Object Model pattern."""
 
-from typing import Self
+from typing import Self, TYPE_CHECKING
 
 from playwright.sync_api import Page, Locator, expect
 
@@ -20,6 +20,8 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url
+        self._base_stripped = base_url.rstrip("/")
+        self._loc_cache: dict[str, Locator] = {}
 
     @property
     def url(self) -> str:
@@ -40,7 +42,7 @@ class BasePage:
         Returns:
             Self for chaining
         """
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}" if path else self.base_url
+        url = f"{self._base_stripped}/{path.lstrip('/')}" if path else self.base_url
         self.page.goto(url)
         return self
 
@@ -98,9 +100,16 @@ class BasePage:
         return self
 
     # Locator methods
+    def _loc(self, selector: str) -> Locator:
+        """Get a cached locator; Locators are lazy handles, so reuse is safe."""
+        locator = self._loc_cache.get(selector)
+        if locator is None:
+            locator = self._loc_cache[selector] = self.page.locator(selector)
+        return locator
+
     def locator(self, selector: str) -> Locator:
         """Get a locator for an element."""
-        return self.page.locator(selector)
+        return self._loc(selector)
 
     def get_by_text(self, text: str, exact: bool = False) -> Locator:
         """Get element by text content."""
@@ -142,41 +151,66 @@ class BasePage:
     # Information
     def is_visible(self, selector: str) -> bool:
         """Check if element is visible."""
-        return self.page.locator(selector).is_visible()
+        return self._loc(selector).is_visible()
 
     def is_enabled(self, selector: str) -> bool:
         """Check if element is enabled."""
-        return self.page.locator(selector).is_enabled()
+        return self._loc(selector).is_enabled()
 
     def text_content(self, selector: str) -> str | None:
         """Get text content of element."""
-        return self.page.locator(selector).text_content()
+        return self._loc(selector).text_content()
 
     def get_attribute(self, selector: str, attribute: str) -> str | None:
         """Get attribute value of element."""
-        return self.page.locator(selector).get_attribute(attribute)
+        return self._loc(selector).get_attribute(attribute)
 
     def count(self, selector: str) -> int:
         """Count matching elements."""
-        return self.page.locator(selector).count()
+        return self._loc(selector).count()
 
-    # Assertions using Playwright expect
-    def expect_visible(self, selector: str) -> Self:
-        """Assert element is visible."""
-        expect(self.page.locator(selector)).to_be_visible()
-        return self
+    # Assertions using Playwright expect: the expect_* helpers below are
+    # generated after the class body from _EXPECT_METHODS. The stubs here
+    # give type checkers and IDEs their signatures.
+    if TYPE_CHECKING:
 
-    def expect_hidden(self, selector: str) -> Self:
-        """Assert element is hidden."""
-        expect(self.page.locator(selector)).to_be_hidden()
-        return self
+        def expect_visible(self, selector: str) -> Self: ...
 
-    def expect_text(self, selector: str, text: str) -> Self:
-        """Assert element has text."""
-        expect(self.page.locator(selector)).to_have_text(text)
-        return self
+        def expect_hidden(self, selector: str) -> Self: ...
 
-    def expect_value(self, selector: str, value: str) -> Self:
-        """Assert input has value."""
-        expect(self.page.locator(selector)).to_have_value(value)
-        return self
+        def expect_text(self, selector: str, text: str) -> Self: ...
+
+        def expect_value(self, selector: str, value: str) -> Self: ...
+
+
+def _make_expect(name: str, assertion: str, param: str | None, doc: str):
+    """Build an expect helper bound to a Playwright assertion.
+
+    The helper is compiled with its real parameter name so keyword
+    callers (e.g. expect_text(sel, text="...")) keep working.
+    """
+    args = f"self, selector: str, {param}: str" if param else "self, selector: str"
+    call = f"({param})" if param else "()"
+    namespace = {"expect": expect}
+    exec(
+        f"def {name}({args}) -> 'Self':\n"
+        f"    getattr(expect(self._loc(selector)), {assertion!r}){call}\n"
+        f"    return self\n",
+        namespace,
+    )
+    helper = namespace[name]
+    helper.__module__ = __name__
+    helper.__qualname__ = f"BasePage.{name}"
+    helper.__doc__ = doc
+    return helper
+
+
+_EXPECT_METHODS = (
+    ("expect_visible", "to_be_visible", None, "Assert element is visible."),
+    ("expect_hidden", "to_be_hidden", None, "Assert element is hidden."),
+    ("expect_text", "to_have_text", "text", "Assert element has text."),
+    ("expect_value", "to_have_value", "value", "Assert input has value."),
+)
+
+for _name, _assertion, _param, _doc in _EXPECT_METHODS:
+    setattr(BasePage, _name, _make_expect(_name, _assertion, _param, _doc))
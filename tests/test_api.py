@@ -1,11 +1,13 @@
 """Tests for API client module."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import timedelta
 
 from webtest_framework.api import (
     APIClient,
+    AsyncAPIClient,
     Response,
     assert_status,
     assert_json_contains,
@@ -73,11 +75,11 @@ class TestAPIClient:
         client.set_auth_token("my-token")
         assert client.default_headers["Authorization"] == "Bearer my-token"
 
-    @patch("requests.Session.request")
+    @patch("httpx.Client.request")
     def test_get(self, mock_request, client):
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.text = '{"data": "test"}'
         mock_response.headers = {"Content-Type": "application/json"}
         mock_response.elapsed = timedelta(milliseconds=50)
@@ -89,11 +91,11 @@ class TestAPIClient:
         assert response.json() == {"data": "test"}
         mock_request.assert_called_once()
 
-    @patch("requests.Session.request")
+    @patch("httpx.Client.request")
     def test_post(self, mock_request, client):
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 1}
+        mock_response.content = b'{"id": 1}'
         mock_response.text = '{"id": 1}'
         mock_response.headers = {}
         mock_response.elapsed = timedelta(milliseconds=100)
@@ -104,6 +106,50 @@ class TestAPIClient:
         assert response.status_code == 201
 
 
+class TestAsyncAPIClient:
+    @staticmethod
+    def _mock_response(body: bytes):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = body
+        mock_response.text = body.decode()
+        mock_response.headers = {}
+        mock_response.elapsed = timedelta(milliseconds=10)
+        return mock_response
+
+    def test_init(self):
+        client = AsyncAPIClient("https://api.example.com")
+        assert client.base_url == "https://api.example.com"
+        assert client.timeout == 10
+
+    @patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+    def test_gather_preserves_order(self, mock_request):
+        mock_request.side_effect = lambda method, url, **kwargs: self._mock_response(
+            f'{{"path": "{url}"}}'.encode()
+        )
+
+        async def run():
+            async with AsyncAPIClient("https://api.example.com") as client:
+                return await client.gather(
+                    [
+                        ("GET", "/users", {}),
+                        ("GET", "/orders", {}),
+                        ("POST", "/items", {"json": {"name": "Test"}}),
+                    ]
+                )
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 3
+        assert all(isinstance(r, Response) for r in responses)
+        assert [r.json()["path"] for r in responses] == [
+            "https://api.example.com/users",
+            "https://api.example.com/orders",
+            "https://api.example.com/items",
+        ]
+        assert mock_request.await_count == 3
+
+
 class TestAssertions:
     def test_assert_status_passes(self):
         response = Response(200, {}, "", {}, 100)